@@ -14,14 +14,135 @@ Date: October 2025
 """
 from __future__ import annotations
 
-from typing import Dict, List, Any, Optional, Tuple, Union
-from datetime import datetime
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple, TypedDict, Union
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import functools
+import itertools
 import json
 import logging
+import logging.handlers
+import queue
+import sys
+import time
 
-# Configure logging for library + demo usage
-logging.basicConfig(level=logging.INFO)
+try:  # optional accelerated JSON; stdlib json is used when unavailable
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+__all__ = [
+    "LegacyAgentAPI",
+    "ModernAgentAPI",
+    "ValidationError",
+    "AgentAPIAdapter",
+    "JobResponse",
+    "StatusResponse",
+]
+
+
+
+def _start_queue_logging(level: int = logging.INFO) -> Optional[logging.handlers.QueueListener]:
+    """Route root logging through a queue drained by a background thread.
+
+    Only the `__main__` demo calls this; importing the module configures nothing.
+
+    Callers only pay for an O(1) enqueue; the stream write happens on the
+    listener thread. Like `logging.basicConfig`, this is a no-op when the root
+    logger already has handlers. The listener is stopped (and flushed) at exit.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+    log_queue: queue.Queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+# Library usage leaves logging configuration to the host application; the demo
+# below opts in via _start_queue_logging()
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Modern job 'type' -> legacy 'action'; unknown types pass through unchanged
+_ACTION_MAP: Dict[str, str] = {
+    "data_processing": "process_data",
+    "classification": "classify",
+    "summarization": "summarize",
+    "ingestion": "ingest",
+}
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause
+# covers both parsers
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps_pretty(obj: Any) -> str:
+    """Serialize `obj` as indented JSON for display (demo output)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+# Placeholder metrics for modern responses; copied per response (a shallow copy of
+# this flat template is cheaper than rebuilding it, unlike deepcopy of a full response)
+_ZERO_METRICS: ModernMetrics = {"duration_ms": 0, "cpu_usage": 0.0}
+
+# job_id reported by safe_act when none can be extracted from the job
+_UNKNOWN_JOB_ID = "unknown"
+
+# Validation helpers return (True, value) on success or (False, error_message)
+_Result = Tuple[bool, Any]
+
+# Keys every modern job must carry; checked as a single subset test
+_JOB_REQUIRED_KEYS: Tuple[str, ...] = ("id", "type", "priority")
+_JOB_REQUIRED_KEYSET = frozenset(_JOB_REQUIRED_KEYS)
+
+# Legacy statuses in order of preference when several are reported
+# Modern status values. Parsed legacy statuses are interned too (see
+# _parse_legacy_status), so comparisons against these short-circuit on identity.
+_S_COMPLETED = sys.intern("COMPLETED")
+_S_RUNNING = sys.intern("RUNNING")
+_S_FAILED = sys.intern("FAILED")
+_S_UNKNOWN = sys.intern("UNKNOWN")
+_STATUS_PRIORITY: Tuple[str, ...] = (_S_COMPLETED, _S_RUNNING, _S_FAILED)
+_PARTIAL_STATUSES = frozenset((_S_RUNNING, _S_UNKNOWN))
+
+@functools.lru_cache(maxsize=128)
+def _parse_legacy_status(status_pipe: str) -> FrozenSet[str]:
+    """Parse a legacy pipe-delimited status string into a set of statuses.
+
+    Legacy backends report from a small vocabulary of combinations, so the
+    parsed result is cached per distinct string.
+    """
+    return frozenset(sys.intern(s.strip()) for s in status_pipe.split("|") if s.strip())
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+_last_iso_prefix: Tuple[int, str] = (-1, "")
+
+
+def _fast_now_iso() -> str:
+    """Return the current local time as an ISO 8601 string with microseconds.
+
+    Equivalent to `datetime.now().isoformat(timespec="microseconds")`, but the
+    date/time prefix is only rebuilt when the wall-clock second changes; calls
+    within the same second just format the microsecond suffix.
+    """
+    global _last_iso_prefix
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _last_iso_prefix
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        # Single tuple assignment keeps the cache consistent across threads
+        _last_iso_prefix = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
 
 
 class LegacyAgentAPI:
@@ -32,10 +153,12 @@ class LegacyAgentAPI:
     - get_status(task_id): returns a pipe-delimited status string
     """
 
+    __slots__ = ("api_key", "base_url")
+
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://legacy-api.example.com"
-        logger.info(f"Initialized LegacyAgentAPI with base URL: {self.base_url}")
+        logger.info("Initialized LegacyAgentAPI with base URL: %s", self.base_url)
 
     def execute_task(self, task_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a task using legacy format.
@@ -47,12 +170,13 @@ class LegacyAgentAPI:
         Returns:
             Dict with keys: 'status', 'result_code', 'output', 'timestamp'
         """
-        logger.info(f"Executing legacy task: {task_id}")
+        if logger.isEnabledFor(logging.INFO):  # per-task; skip record creation when muted
+            logger.info("Executing legacy task: %s", task_id)
         return {
             "status": "completed",
             "result_code": 200,
             "output": f"Task {task_id} executed with action {params.get('action')}",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _fast_now_iso(),
         }
 
     def get_status(self, task_id: str) -> str:
@@ -68,6 +192,8 @@ class ModernAgentAPI:
     exposes a similar interface while delegating to the legacy API internally.
     """
 
+    __slots__ = ("credentials",)
+
     def __init__(self, credentials: Dict[str, str]):
         self.credentials = credentials
 
@@ -79,7 +205,55 @@ class ModernAgentAPI:
 
 
 class ValidationError(ValueError):
-    """Raised when incoming parameters fail validation."""
+    """Raised when incoming parameters fail validation.
+
+    The adapter's own request path reports validation failures as result tuples
+    (see the validation helpers); this type remains for callers and subclasses
+    that prefer to raise.
+    """
+
+
+# --------------- Modern response shapes ---------------
+# Responses stay plain dicts (the documented modern contract, and directly
+# JSON-serializable); these TypedDicts pin their fixed shape for type checkers.
+class ModernMetrics(TypedDict):
+    duration_ms: int
+    cpu_usage: float
+
+
+class JobResultData(TypedDict):
+    job_id: str
+    result: Any
+    metrics: ModernMetrics
+
+
+class _JobStatusDataBase(TypedDict):
+    job_id: Any
+    status: str
+
+
+class JobStatusData(_JobStatusDataBase, total=False):
+    error: str  # present only on failed queries
+
+
+class JobResponse(TypedDict):
+    """Modern response returned by `run` and `safe_act`."""
+
+    success: bool
+    code: int
+    data: JobResultData
+    created_at: str
+    completed_at: str
+
+
+class StatusResponse(TypedDict):
+    """Modern response returned by `query_status`."""
+
+    success: bool
+    code: int
+    data: JobStatusData
+    created_at: str
+    completed_at: str
 
 
 class AgentAPIAdapter:
@@ -91,74 +265,120 @@ class AgentAPIAdapter:
     - Provide a safe fallback path via `safe_act` when strict execution fails
 
     Modern interface provided:
-    - run(job: Dict[str, Any]) -> Dict[str, Any]
-    - query_status(job_id: str) -> Dict[str, Any]
-    - safe_act(job: Dict[str, Any]) -> Dict[str, Any]
+    - run(job: Dict[str, Any]) -> JobResponse
+    - run_batch(jobs: List[Dict[str, Any]]) -> List[JobResponse]
+    - query_status(job_id: str) -> StatusResponse
+    - safe_act(job: Dict[str, Any]) -> JobResponse
 
     Response invariants (modern shape):
-    - Always returns a dictionary with keys: success(bool), code(int), data(dict),
+    - Always returns a plain dictionary with keys: success(bool), code(int), data(dict),
       created_at(str, ISO 8601), completed_at(str, ISO 8601)
     """
 
+    __slots__ = ("legacy_api", "_job_validator", "_status_query_validator")
+
     def __init__(self, legacy_api: LegacyAgentAPI):
         self.legacy_api = legacy_api
+        # Bind the validators once so each request skips descriptor binding. They
+        # only read immutable module constants, so one bound callable is safe to
+        # share across threads and calls.
+        self._job_validator = type(self)._validate_job
+        self._status_query_validator = type(self)._validate_status_query
 
     # --------------- Validation & Conversion helpers ---------------
+    # Malformed input is an expected outcome for a public API, so the helpers
+    # report it as an (ok, value_or_error_message) result instead of raising;
+    # exceptions stay reserved for genuinely unexpected failures.
     @staticmethod
-    def _require_keys(mapping: Dict[str, Any], keys: List[str], ctx: str) -> None:
+    def _require_keys(mapping: Dict[str, Any], keys: List[str], ctx: str) -> _Result:
         missing = [k for k in keys if k not in mapping]
         if missing:
-            raise ValidationError(f"Missing required keys in {ctx}: {missing}")
+            return False, f"Missing required keys in {ctx}: {missing}"
+        return True, None
 
     @staticmethod
-    def _coerce_priority(value: Any) -> int:
+    def _coerce_priority(value: Any) -> _Result:
         """Coerce priority to int within 1..5.
 
         Accepts int-like strings; clamps to the inclusive range [1, 5].
         """
-        if isinstance(value, bool):  # avoid True/False being treated as 1/0
-            raise ValidationError("Priority must be an integer 1..5, not boolean")
-        try:
-            iv = int(value)
-        except (TypeError, ValueError):
-            raise ValidationError("Priority must be an integer 1..5")
-        return max(1, min(5, iv))
+        if type(value) is int:  # fast path for the common case; excludes bool
+            iv = value
+        else:
+            if isinstance(value, bool):  # avoid True/False being treated as 1/0
+                return False, "Priority must be an integer 1..5, not boolean"
+            try:
+                iv = int(value)
+            except (TypeError, ValueError):
+                return False, "Priority must be an integer 1..5"
+        return True, 1 if iv < 1 else (5 if iv > 5 else iv)
 
     @staticmethod
-    def _coerce_action(job_type: Any) -> str:
+    def _coerce_action(job_type: Any) -> _Result:
         """Map modern job 'type' to a legacy 'action'."""
         if not isinstance(job_type, str) or not job_type.strip():
-            raise ValidationError("job.type must be a non-empty string")
-        mapping = {
-            "data_processing": "process_data",
-            "classification": "classify",
-            "summarization": "summarize",
-            "ingestion": "ingest",
-        }
-        return mapping.get(job_type, job_type)  # default: pass-through
+            return False, "job.type must be a non-empty string"
+        return True, _ACTION_MAP.get(job_type, job_type)  # default: pass-through
 
     @staticmethod
-    def _normalize_payload(payload: Any) -> Dict[str, Any]:
+    def _normalize_payload(payload: Any) -> _Result:
         """Ensure payload is a dictionary; parse JSON strings when provided."""
         if payload is None:
-            return {}
+            return True, {}
         if isinstance(payload, dict):
-            return payload
+            return True, payload
         if isinstance(payload, str):
             payload = payload.strip()
             if not payload:
-                return {}
+                return True, {}
             try:
-                parsed = json.loads(payload)
+                parsed = _json_loads(payload)
             except json.JSONDecodeError:
-                raise ValidationError("payload string must be valid JSON object")
+                return False, "payload string must be valid JSON object"
             if not isinstance(parsed, dict):
-                raise ValidationError("payload JSON must decode to an object")
-            return parsed
-        raise ValidationError("payload must be a dict or JSON string")
+                return False, "payload JSON must decode to an object"
+            return True, parsed
+        return False, "payload must be a dict or JSON string"
+
+    @classmethod
+    def _validate_job(cls, job: Any) -> _Result:
+        """Validate a modern job in one pass and return its legacy-ready fields.
+
+        On success the value is (job_id, action, priority, payload). The
+        required-key check is a single subset test against a prebuilt frozenset;
+        the per-key message is only computed on failure.
+        """
+        if not isinstance(job, dict):
+            return False, "job must be a dictionary"
+        if not _JOB_REQUIRED_KEYSET.issubset(job):
+            return cls._require_keys(job, list(_JOB_REQUIRED_KEYS), ctx="job")
+
+        jid = job["id"]
+        job_id = jid.strip() if type(jid) is str else str(jid).strip()
+        if not job_id:
+            return False, "job.id must be a non-empty string"
+
+        ok, action = cls._coerce_action(job["type"])
+        if not ok:
+            return ok, action
+        ok, priority = cls._coerce_priority(job["priority"])
+        if not ok:
+            return ok, priority
+        ok, payload = cls._normalize_payload(job.get("payload"))
+        if not ok:
+            return ok, payload
+        return True, (job_id, action, priority, payload)
+
+    @staticmethod
+    def _validate_status_query(job_id: Any) -> _Result:
+        """Validate a status-query job ID; the value is the stripped ID."""
+        stripped = job_id.strip() if isinstance(job_id, str) else ""
+        if not stripped:
+            return False, "job_id must be a non-empty string"
+        return True, stripped
 
     # --------------- Public modern methods ---------------
-    def run(self, job: Dict[str, Any]) -> Dict[str, Any]:
+    def run(self, job: Any) -> JobResponse:
         """Execute a modern job via the legacy API.
 
         Expected job shape (modern):
@@ -171,19 +391,37 @@ class AgentAPIAdapter:
         Returns modern-shaped response; on validation or runtime errors falls back to
         `safe_act` when possible to provide a graceful response.
         """
-        created_at = datetime.now().isoformat()
-        try:
-            if not isinstance(job, dict):
-                raise ValidationError("job must be a dictionary")
-            self._require_keys(job, ["id", "type", "priority"], ctx="job")
+        return self._run_one(job, _fast_now_iso())
 
-            job_id = str(job["id"]).strip()
-            if not job_id:
-                raise ValidationError("job.id must be a non-empty string")
+    def run_batch(self, jobs: List[Any], *, max_workers: Optional[int] = None) -> List[JobResponse]:
+        """Execute many modern jobs, amortizing per-call overhead across the batch.
 
-            action = self._coerce_action(job.get("type"))
-            priority = self._coerce_priority(job.get("priority"))
-            payload = self._normalize_payload(job.get("payload"))
+        Each job is handled exactly as `run` would handle it, including the
+        `safe_act` fallback, so one malformed job never fails the whole batch.
+        All responses share a single `created_at` timestamp and are returned in
+        input order.
+
+        Args:
+            jobs: Modern job dictionaries (see `run` for the expected shape)
+            max_workers: When greater than 1, dispatch jobs on a thread pool of this
+                size to overlap I/O-bound legacy calls; by default jobs run
+                sequentially on the calling thread
+        """
+        created_at = _fast_now_iso()
+        run_one = self._run_one
+        if max_workers is not None and max_workers > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(run_one, jobs, itertools.repeat(created_at)))
+        return [run_one(job, created_at) for job in jobs]
+
+    def _run_one(self, job: Any, created_at: str) -> JobResponse:
+        """Run a single job with a caller-supplied `created_at` (see `run`)."""
+        try:
+            ok, fields = self._job_validator(job)
+            if not ok:
+                logger.warning("Validation failed for job: %s", fields)
+                return self.safe_act(job, error_msg=fields, created_at=created_at)
+            job_id, action, priority, payload = fields
 
             # Compose legacy params
             legacy_params = {
@@ -195,30 +433,25 @@ class AgentAPIAdapter:
             legacy_resp = self.legacy_api.execute_task(task_id=job_id, params=legacy_params)
 
             # Convert legacy to modern response shape
-            modern = {
-                "success": legacy_resp.get("result_code", 500) == 200,
-                "code": int(legacy_resp.get("result_code", 500)),
+            code = int(legacy_resp.get("result_code", 500))
+            modern: JobResponse = {
+                "success": code == 200,
+                "code": code,
                 "data": {
                     "job_id": job_id,
                     "result": legacy_resp.get("output"),
-                    "metrics": {
-                        # In a real system, transform or compute metrics
-                        "duration_ms": 0,
-                        "cpu_usage": 0.0,
-                    },
+                    # In a real system, transform or compute metrics
+                    "metrics": _ZERO_METRICS.copy(),
                 },
                 "created_at": created_at,
-                "completed_at": legacy_resp.get("timestamp", datetime.now().isoformat()),
+                "completed_at": legacy_resp.get("timestamp") or _fast_now_iso(),
             }
             return modern
-        except ValidationError as ve:
-            logger.warning(f"Validation failed for job: {ve}")
-            return self.safe_act(job, error_msg=str(ve), created_at=created_at)
         except Exception as e:
             logger.exception("Unexpected error while running job")
             return self.safe_act(job, error_msg=str(e), created_at=created_at)
 
-    def query_status(self, job_id: str) -> Dict[str, Any]:
+    def query_status(self, job_id: Any) -> StatusResponse:
         """Query status for a job ID and convert to modern structure.
 
         Modern shape:
@@ -227,22 +460,26 @@ class AgentAPIAdapter:
         - data: { job_id, status: one-of [RUNNING, COMPLETED, FAILED, UNKNOWN] }
         - created_at/completed_at: ISO 8601 timestamps for traceability
         """
-        created_at = datetime.now().isoformat()
+        created_at = _fast_now_iso()
         try:
-            if not isinstance(job_id, str) or not job_id.strip():
-                raise ValidationError("job_id must be a non-empty string")
-            legacy_status_pipe = self.legacy_api.get_status(job_id.strip())
-            options = [s.strip() for s in str(legacy_status_pipe).split("|") if s.strip()]
+            ok, task_id = self._status_query_validator(job_id)
+            if not ok:
+                logger.warning("Validation failed for status query: %s", task_id)
+                return {
+                    "success": False,
+                    "code": 400,
+                    "data": {"job_id": job_id, "status": _S_UNKNOWN, "error": task_id},
+                    "created_at": created_at,
+                    "completed_at": _fast_now_iso(),
+                }
+            legacy_status_pipe = self.legacy_api.get_status(task_id)
+            options = _parse_legacy_status(str(legacy_status_pipe))
 
             # Pick the most favorable status deterministically for demo; real code would map actual state
-            status = "UNKNOWN"
-            for candidate in ("COMPLETED", "RUNNING", "FAILED"):
-                if candidate in options:
-                    status = candidate
-                    break
-
-            success = status == "COMPLETED"
-            code = 200 if success else (206 if status in {"RUNNING", "UNKNOWN"} else 500)
+            status = next((c for c in _STATUS_PRIORITY if c in options), _S_UNKNOWN)
+
+            success = status == _S_COMPLETED
+            code = 200 if success else (206 if status in _PARTIAL_STATUSES else 500)
             return {
                 "success": success,
                 "code": code,
@@ -251,29 +488,20 @@ class AgentAPIAdapter:
                     "status": status,
                 },
                 "created_at": created_at,
-                "completed_at": datetime.now().isoformat(),
-            }
-        except ValidationError as ve:
-            logger.warning(f"Validation failed for status query: {ve}")
-            return {
-                "success": False,
-                "code": 400,
-                "data": {"job_id": job_id, "status": "UNKNOWN", "error": str(ve)},
-                "created_at": created_at,
-                "completed_at": datetime.now().isoformat(),
+                "completed_at": _fast_now_iso(),
             }
         except Exception as e:
             logger.exception("Unexpected error while querying status")
             return {
                 "success": False,
                 "code": 500,
-                "data": {"job_id": job_id, "status": "UNKNOWN", "error": str(e)},
+                "data": {"job_id": job_id, "status": _S_UNKNOWN, "error": str(e)},
                 "created_at": created_at,
-                "completed_at": datetime.now().isoformat(),
+                "completed_at": _fast_now_iso(),
             }
 
     # --------------- Fallback path ---------------
-    def safe_act(self, job: Dict[str, Any], *, error_msg: str, created_at: Optional[str] = None) -> Dict[str, Any]:
+    def safe_act(self, job: Any, *, error_msg: str, created_at: Optional[str] = None) -> JobResponse:
         """Return a conservative, consistent response when strict execution fails.
 
         Behavior:
@@ -286,10 +514,11 @@ class AgentAPIAdapter:
             error_msg: Human-readable error message used for diagnostics
             created_at: Optional created time to preserve trace continuity
         """
-        job_id = "unknown"
+        job_id = _UNKNOWN_JOB_ID
         try:
-            if isinstance(job, dict) and job.get("id"):
-                job_id = str(job.get("id")).strip() or "unknown"
+            jid = job.get("id") if isinstance(job, dict) else None
+            if jid:
+                job_id = (jid.strip() if type(jid) is str else str(jid).strip()) or _UNKNOWN_JOB_ID
         except Exception:
             # Ignore extraction issues
             pass
@@ -300,15 +529,17 @@ class AgentAPIAdapter:
             "data": {
                 "job_id": job_id,
                 "result": f"Error: {error_msg}",
-                "metrics": {"duration_ms": 0, "cpu_usage": 0.0},
+                "metrics": _ZERO_METRICS.copy(),
             },
-            "created_at": created_at or datetime.now().isoformat(),
-            "completed_at": datetime.now().isoformat(),
+            "created_at": created_at or _fast_now_iso(),
+            "completed_at": _fast_now_iso(),
         }
 
 
 # ------------------------- Example usage -------------------------
 if __name__ == "__main__":
+    _start_queue_logging(logging.INFO)
+
     print("=" * 70)
     print("Agent API Adapter Example")
     print("=" * 70)
@@ -336,14 +567,14 @@ if __name__ == "__main__":
     result = adapter.run(modern_job)
 
     print("\nModern API Response:")
-    print(json.dumps(result, indent=2))
+    print(_json_dumps_pretty(result))
 
     # Query job status
     print("\nQuerying job status...")
     status = adapter.query_status("job_2025_001")
 
     print("\nStatus Response:")
-    print(json.dumps(status, indent=2))
+    print(_json_dumps_pretty(status))
 
     print("\n" + "=" * 70)
     print("Adapter successfully bridged legacy API to modern interface!")
@@ -0,0 +1,17 @@
+"""Shared pytest hooks for the test suite."""
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run tests that failed in the previous session first.
+
+    Equivalent to always passing ``--ff``: the sort is stable, so collection
+    order is kept within the failed and passing groups. Combined with ``-x``
+    this surfaces a known failure immediately. A no-op when the cache plugin
+    is disabled (``-p no:cacheprovider``).
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return
+    last_failed = cache.get("cache/lastfailed", {})
+    if last_failed:
+        items.sort(key=lambda item: item.nodeid not in last_failed)
@@ -0,0 +1,103 @@
+"""Dummy modules and adapter exercised by test_integration.py.
+
+Kept apart from the test module so they are plain, fully annotated Python
+that mypyc can compile (mypyc cannot compile pytest test modules).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, NamedTuple, Tuple
+
+
+class SentMsg(NamedTuple):
+    """Message envelope returned by DummyModuleA.send_message."""
+    
+    source: str
+    target: str
+    message: Any
+    status: str = "sent"
+
+
+class RecvMsg(NamedTuple):
+    """Acknowledgement returned by DummyModuleB.receive_message."""
+    
+    receiver: str
+    received: Any
+    acknowledged: bool = True
+
+
+def _make_result(name: str, data: Any) -> Dict[str, Any]:
+    """Build the processing result shared by both dummy modules."""
+    return {"processed_by": name, "data": data, "status": "success"}
+
+
+@dataclass(slots=True)
+class DummyModuleA:
+    """Dummy module simulating Module A."""
+    
+    name: str = "ModuleA"
+    status: str = "initialized"
+    
+    def send_message(self, target_module: str, message: Any) -> SentMsg:
+        """Send a message to another module."""
+        return SentMsg(self.name, target_module, message)
+    
+    def process(self, data: Any) -> Dict[str, Any]:
+        """Process data and return result."""
+        return _make_result(self.name, data)
+
+
+@dataclass(slots=True)
+class DummyModuleB:
+    """Dummy module simulating Module B."""
+    
+    name: str = "ModuleB"
+    status: str = "initialized"
+    
+    def receive_message(self, message_data: Any) -> RecvMsg:
+        """Receive and acknowledge a message."""
+        return RecvMsg(self.name, message_data)
+    
+    def process(self, data: Any) -> Dict[str, Any]:
+        """Process data and return result."""
+        return _make_result(self.name, data)
+
+
+class IntegrationAdapter:
+    """Simple adapter for module integration."""
+    
+    __slots__ = ("module_a", "module_b", "_send", "_recv", "_b_name", "_connected")
+    
+    _send: Callable[[str, Any], SentMsg]
+    _recv: Callable[[Any], RecvMsg]
+    _b_name: str
+    _connected: bool
+    
+    def __init__(self, module_a: DummyModuleA, module_b: DummyModuleB) -> None:
+        self.module_a = module_a
+        self.module_b = module_b
+        self.invalidate()
+    
+    @property
+    def connected(self) -> bool:
+        """Cached readiness of both modules (refreshed by `invalidate`)."""
+        return self._connected
+    
+    def connect_modules(self) -> bool:
+        """Verify both modules are initialized and ready."""
+        return self._connected
+    
+    def invalidate(self) -> None:
+        """Re-check module readiness and rebind module hooks after a change."""
+        # Bound once so forward_message skips the attribute chains per call
+        self._send = self.module_a.send_message
+        self._recv = self.module_b.receive_message
+        self._b_name = self.module_b.name
+        self._connected = (
+            self.module_a.status == "initialized" and
+            self.module_b.status == "initialized"
+        )
+    
+    def forward_message(self, message: Any) -> Tuple[SentMsg, RecvMsg]:
+        """Forward message from Module A to Module B."""
+        sent = self._send(self._b_name, message)
+        return sent, self._recv(sent)
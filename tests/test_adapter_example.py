@@ -0,0 +1,112 @@
+"""Tests for the reference adapter in adapter_example.py.
+
+These tests pin the modern response shape and the validation/fallback
+behavior documented on AgentAPIAdapter.
+"""
+
+import pytest
+
+from adapter_example import AgentAPIAdapter, LegacyAgentAPI
+
+
+# Test Fixtures
+@pytest.fixture
+def adapter():
+    """Provide an adapter wired to a fresh legacy API stub."""
+    return AgentAPIAdapter(LegacyAgentAPI(api_key="test_key"))
+
+
+@pytest.fixture
+def job():
+    """Provide a well-formed modern job."""
+    return {
+        "id": "job_001",
+        "type": "data_processing",
+        "priority": 3,
+        "payload": {"input_file": "data.csv"},
+    }
+
+
+@pytest.mark.fast
+class TestRun:
+    """Test AgentAPIAdapter.run on valid and malformed jobs."""
+
+    def test_valid_job(self, adapter, job):
+        """Verify a valid job maps its type to the legacy action."""
+        result = adapter.run(job)
+
+        assert result["success"] is True
+        assert result["code"] == 200
+        assert result["data"]["job_id"] == "job_001"
+        assert "process_data" in result["data"]["result"]
+        assert result["created_at"] <= result["completed_at"]
+
+    def test_priority_string_is_clamped(self, adapter, job):
+        """Verify int-like string priorities are accepted and clamped."""
+        ok, fields = AgentAPIAdapter._validate_job(dict(job, priority="9"))
+        assert ok is True
+        assert fields == ("job_001", "process_data", 5, job["payload"])
+
+        ok, fields = AgentAPIAdapter._validate_job(dict(job, priority=-1))
+        assert fields[2] == 1
+
+    @pytest.mark.parametrize(
+        "bad_job, message",
+        [
+            pytest.param(None, "job must be a dictionary", id="not-dict"),
+            pytest.param({"id": "x"}, "Missing required keys", id="missing-keys"),
+            pytest.param({"id": " ", "type": "t", "priority": 1}, "job.id", id="blank-id"),
+            pytest.param({"id": "x", "type": "", "priority": 1}, "job.type", id="blank-type"),
+            pytest.param({"id": "x", "type": "t", "priority": True}, "not boolean", id="bool-priority"),
+            pytest.param({"id": "x", "type": "t", "priority": 1, "payload": "[1]"}, "object", id="payload-list"),
+        ],
+    )
+    def test_invalid_job_falls_back(self, adapter, bad_job, message):
+        """Verify validation failures return the safe_act error shape."""
+        result = adapter.run(bad_job)
+
+        assert result["success"] is False
+        assert result["code"] == 500
+        assert message in result["data"]["result"]
+
+
+@pytest.mark.fast
+class TestRunBatch:
+    """Test AgentAPIAdapter.run_batch."""
+
+    @pytest.mark.parametrize("max_workers", [None, 4], ids=["sequential", "threaded"])
+    def test_results_in_input_order(self, adapter, job, max_workers):
+        """Verify per-job results keep input order and share created_at."""
+        jobs = [dict(job, id=f"job_{i:03d}") for i in range(8)]
+        jobs[3] = {"id": "bad"}
+
+        results = adapter.run_batch(jobs, max_workers=max_workers)
+
+        assert [r["data"]["job_id"] for r in results] == [j["id"] for j in jobs]
+        assert [r["success"] for r in results] == [i != 3 for i in range(8)]
+        assert len({r["created_at"] for r in results}) == 1
+
+    def test_empty_batch(self, adapter):
+        """Verify an empty batch returns an empty list."""
+        assert adapter.run_batch([]) == []
+
+
+@pytest.mark.fast
+class TestQueryStatus:
+    """Test AgentAPIAdapter.query_status."""
+
+    def test_prefers_completed(self, adapter):
+        """Verify COMPLETED wins when the legacy API reports several statuses."""
+        result = adapter.query_status("job_001")
+
+        assert result["success"] is True
+        assert result["code"] == 200
+        assert result["data"] == {"job_id": "job_001", "status": "COMPLETED"}
+
+    def test_blank_job_id(self, adapter):
+        """Verify a blank job_id is rejected with a 400."""
+        result = adapter.query_status("  ")
+
+        assert result["success"] is False
+        assert result["code"] == 400
+        assert result["data"]["status"] == "UNKNOWN"